@@ -1,16 +1,23 @@
 from typing import Final
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from bot.misc import SingletonMeta
 
 
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.close()
+
+
 class Database(metaclass=SingletonMeta):
     BASE: Final = declarative_base()
 
     def __init__(self):
         self.__engine = create_engine(f'sqlite:///database.db')
+        event.listen(self.__engine, 'connect', _set_sqlite_pragma)
         session = sessionmaker(bind=self.__engine)
         self.__session = session()
 
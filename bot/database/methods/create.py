@@ -1,7 +1,7 @@
 import sqlalchemy.exc
 import random
 from bot.database.models import User, ItemValues, Goods, Categories, BoughtGoods, \
-    Operations, UnfinishedOperations
+    Operations, UnfinishedOperations, CryptoInvoices
 from bot.database import Database
 
 
@@ -68,3 +68,12 @@ def add_bought_item(item_name: str, value: str, price: int, buyer_id: int,
         BoughtGoods(name=item_name, value=value, price=price, buyer_id=buyer_id, bought_datetime=bought_time,
                     unique_id=str(random.randint(1000000000, 9999999999))))
     session.commit()
+
+
+def create_crypto_invoice(invoice_id: str, currency: str, address: str, amount: float, private: str,
+                          created_at: float) -> None:
+    session = Database().session
+    session.add(
+        CryptoInvoices(invoice_id=invoice_id, currency=currency, address=address, amount=amount,
+                       private=private, created_at=created_at))
+    session.commit()
@@ -4,7 +4,7 @@ import sqlalchemy
 from sqlalchemy import exc, func
 
 from bot.database.models import Database, User, ItemValues, Goods, Categories, Role, BoughtGoods, \
-    Operations, UnfinishedOperations
+    Operations, UnfinishedOperations, CryptoInvoices
 
 
 def check_user(telegram_id: int) -> User | None:
@@ -242,3 +242,14 @@ def check_user_referrals(user_id: int) -> list[int]:
 def get_user_referral(user_id: int) -> int | None:
     result = Database().session.query(User.referral_id).filter(User.telegram_id == user_id).first()
     return result[0] if result else None
+
+
+def get_crypto_invoice(invoice_id: str) -> CryptoInvoices | None:
+    return Database().session.query(CryptoInvoices).filter(CryptoInvoices.id == invoice_id).first()
+
+
+def select_pending_crypto_invoices(created_after: float) -> list[CryptoInvoices]:
+    return Database().session.query(CryptoInvoices).filter(
+        CryptoInvoices.paid.is_(False),
+        CryptoInvoices.created_at >= created_after
+    ).all()
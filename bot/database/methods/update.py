@@ -1,4 +1,4 @@
-from bot.database.models import User, ItemValues, Goods, Categories
+from bot.database.models import User, ItemValues, Goods, Categories, CryptoInvoices
 from bot.database import Database
 
 
@@ -50,3 +50,15 @@ def update_category(category_name: str, new_name: str) -> None:
     Database().session.query(Categories).filter(Categories.name == category_name).update(
         values={Categories.name: new_name})
     Database().session.commit()
+
+
+def set_crypto_invoice_paid(invoice_id: str) -> None:
+    Database().session.query(CryptoInvoices).filter(CryptoInvoices.id == invoice_id).update(
+        values={CryptoInvoices.paid: True})
+    Database().session.commit()
+
+
+def set_crypto_invoice_forwarded(invoice_id: str) -> None:
+    Database().session.query(CryptoInvoices).filter(CryptoInvoices.id == invoice_id).update(
+        values={CryptoInvoices.forwarded: True})
+    Database().session.commit()
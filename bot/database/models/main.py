@@ -1,5 +1,5 @@
 import datetime
-from sqlalchemy import Column, Integer, String, BigInteger, ForeignKey, Text, Boolean, VARCHAR
+from sqlalchemy import Column, Integer, String, BigInteger, ForeignKey, Text, Boolean, VARCHAR, Float
 from bot.database.main import Database
 from sqlalchemy.orm import relationship
 
@@ -182,6 +182,29 @@ class UnfinishedOperations(Database.BASE):
         self.operation_id = operation_id
 
 
+class CryptoInvoices(Database.BASE):
+    __tablename__ = 'crypto_invoices'
+    id = Column(String(50), nullable=False, primary_key=True)
+    currency = Column(String(10), nullable=False)
+    address = Column(String(128), nullable=False)
+    amount = Column(Float, nullable=False)
+    private = Column(Text, nullable=False)
+    paid = Column(Boolean, nullable=False, default=False)
+    forwarded = Column(Boolean, nullable=False, default=False)
+    created_at = Column(Float, nullable=False, index=True)
+
+    def __init__(self, invoice_id: str, currency: str, address: str, amount: float, private: str,
+                 created_at: float):
+        self.id = invoice_id
+        self.currency = currency
+        self.address = address
+        self.amount = amount
+        self.private = private
+        self.paid = False
+        self.forwarded = False
+        self.created_at = created_at
+
+
 def register_models():
     Database.BASE.metadata.create_all(Database().engine)
     Role.insert_roles()
@@ -23,7 +23,7 @@ from bot.localization import t
 from bot.logger_mesh import logger
 from bot.misc import TgConfig, EnvKeys
 from bot.misc.payment import quick_pay, check_payment_status
-from bot.misc.crypto_payment import create_invoice, check_transaction_status
+from bot.misc.crypto_payment import create_invoice, check_transaction_status, wait_paid
 
 
 
@@ -506,7 +506,7 @@ async def crypto_payment(call: CallbackQuery):
                                       f'⌛️ You have {int(sleep_time / 60)} minutes to pay.\n'
                                       f'<b>❗️ After payment press "Check payment"</b>'),
                                 reply_markup=markup)
-    await asyncio.sleep(sleep_time)
+    await wait_paid(invoice_id, sleep_time)
     info = select_unfinished_operations(invoice_id)
     if info:
         status = await check_transaction_status(invoice_id)
@@ -43,7 +43,16 @@ LANGUAGES = {
     },
 }
 
+# (lang, key) -> template, with missing keys falling back to English
+_FLAT = {
+    (lang, key): entries.get(key, LANGUAGES['en'][key])
+    for lang, entries in LANGUAGES.items()
+    for key in LANGUAGES['en']
+}
+
+
 def t(lang: str, key: str, **kwargs) -> str:
-    lang_data = LANGUAGES.get(lang, LANGUAGES['en'])
-    template = lang_data.get(key, '')
+    template = _FLAT.get((lang, key))
+    if template is None:
+        template = _FLAT.get(('en', key), '')
     return template.format(**kwargs)
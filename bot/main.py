@@ -1,3 +1,5 @@
+import asyncio
+
 from aiogram.utils import executor
 from aiogram import Bot, Dispatcher
 from aiogram.contrib.fsm_storage.memory import MemoryStorage
@@ -6,18 +8,31 @@ from bot.filters import register_all_filters
 from bot.misc import EnvKeys
 from bot.handlers import register_all_handlers
 from bot.database.models import register_models
+from bot.misc.crypto_payment import close_session, close_sol_client, watch_invoices
 from bot.logger_mesh import logger, file_handler
 
 logger.addHandler(file_handler)
 
+_invoice_watcher: asyncio.Task | None = None
+
 
 async def __on_start_up(dp: Dispatcher) -> None:
     register_all_filters(dp)
     register_all_handlers(dp)
     register_models()
+    global _invoice_watcher
+    _invoice_watcher = asyncio.create_task(watch_invoices())
+
+
+async def __on_shut_down(dp: Dispatcher) -> None:
+    if _invoice_watcher is not None:
+        _invoice_watcher.cancel()
+        await asyncio.gather(_invoice_watcher, return_exceptions=True)
+    await close_session()
+    await close_sol_client()
 
 
 def start_bot():
     bot = Bot(token=EnvKeys.TOKEN, parse_mode='HTML')
     dp = Dispatcher(bot, storage=MemoryStorage())
-    executor.start_polling(dp, skip_updates=True, on_startup=__on_start_up)
+    executor.start_polling(dp, skip_updates=True, on_startup=__on_start_up, on_shutdown=__on_shut_down)
@@ -1,18 +1,32 @@
 import os
-from abc import ABC
-from typing import Final
+from dataclasses import dataclass
 from dotenv import load_dotenv  # <-- Import this
 
 # Load variables from .env file
 load_dotenv()  # <-- Call this before accessing environment variables
 
-class EnvKeys(ABC):
-    TOKEN: Final = os.environ.get('TOKEN')
-    OWNER_ID: Final = os.environ.get('OWNER_ID')
-    ACCESS_TOKEN: Final = os.environ.get('ACCESS_TOKEN')
-    ACCOUNT_NUMBER: Final = os.environ.get('ACCOUNT_NUMBER')
 
-    BLOCKCYPHER_TOKEN: Final = os.environ.get('BLOCKCYPHER_TOKEN')
+@dataclass(frozen=True, slots=True)
+class _Env:
+    TOKEN: str | None
+    OWNER_ID: str | None
+    ACCESS_TOKEN: str | None
+    ACCOUNT_NUMBER: str | None
 
-    SHK_API_KEY: Final = os.environ.get('SHK_API_KEY')
-    SHK_MERCHANT_ID: Final = os.environ.get('SHK_MERCHANT_ID')
+    BLOCKCYPHER_TOKEN: str | None
+
+    SHK_API_KEY: str | None
+    SHK_MERCHANT_ID: str | None
+
+
+EnvKeys = _Env(
+    TOKEN=os.environ.get('TOKEN'),
+    OWNER_ID=os.environ.get('OWNER_ID'),
+    ACCESS_TOKEN=os.environ.get('ACCESS_TOKEN'),
+    ACCOUNT_NUMBER=os.environ.get('ACCOUNT_NUMBER'),
+
+    BLOCKCYPHER_TOKEN=os.environ.get('BLOCKCYPHER_TOKEN'),
+
+    SHK_API_KEY=os.environ.get('SHK_API_KEY'),
+    SHK_MERCHANT_ID=os.environ.get('SHK_MERCHANT_ID'),
+)
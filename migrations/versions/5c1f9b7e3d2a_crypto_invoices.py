@@ -0,0 +1,37 @@
+"""crypto invoices
+
+Revision ID: 5c1f9b7e3d2a
+Revises: a2e0ad4f2c8d
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f9b7e3d2a'
+down_revision: Union[str, None] = 'a2e0ad4f2c8d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('crypto_invoices',
+                    sa.Column('id', sa.String(length=50), nullable=False),
+                    sa.Column('currency', sa.String(length=10), nullable=False),
+                    sa.Column('address', sa.String(length=128), nullable=False),
+                    sa.Column('amount', sa.Float(), nullable=False),
+                    sa.Column('private', sa.Text(), nullable=False),
+                    sa.Column('paid', sa.Boolean(), nullable=False),
+                    sa.Column('forwarded', sa.Boolean(), nullable=False),
+                    sa.Column('created_at', sa.Float(), nullable=False),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index(op.f('ix_crypto_invoices_created_at'), 'crypto_invoices', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_crypto_invoices_created_at'), table_name='crypto_invoices')
+    op.drop_table('crypto_invoices')
@@ -5,6 +5,9 @@ import sys
 REQUIRED_MODULES = [
     "yoomoney",
     "aiogram",
+    "aiohttp",
+    "cachetools",
+    "orjson",
     "sqlalchemy",
     "requests",
     "alembic",